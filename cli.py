@@ -8,9 +8,11 @@ Command-line interface for managing BountyPing.
 import argparse
 import logging
 import sys
+from contextlib import ExitStack
 
 from config import DB_PATH
 from db.database import BountyDatabase
+from scrapers.base import run_scrapers
 from scrapers.hackerone import HackerOneScraper
 from scrapers.projectdiscovery import ProjectDiscoveryScraper
 from notifiers.discord import DiscordNotifier
@@ -25,12 +27,14 @@ logger = logging.getLogger(__name__)
 def cmd_seed(args):
     """Seed database with ProjectDiscovery data"""
     db = BountyDatabase(args.db)
-    scraper = ProjectDiscoveryScraper(db)
 
     logger.info("Seeding database with ProjectDiscovery data...")
-    log = scraper.run()
+    with ProjectDiscoveryScraper(db) as scraper:
+        log = scraper.run()
 
-    if log.success:
+    if log.success and log.unchanged:
+        print("\n✅ ProjectDiscovery list unchanged since the last seed, nothing to do")
+    elif log.success:
         print(f"\n✅ Seed complete!")
         print(f"  Found: {log.programs_found}")
         print(f"  New: {log.programs_new}")
@@ -41,7 +45,7 @@ def cmd_seed(args):
 
 
 def cmd_scrape(args):
-    """Run scraper for a specific platform"""
+    """Run scraper for a specific platform, or all of them concurrently"""
     db = BountyDatabase(args.db)
 
     scrapers = {
@@ -50,28 +54,40 @@ def cmd_scrape(args):
     }
 
     platform = args.platform.lower()
-    if platform not in scrapers:
+    if platform == 'all':
+        platforms = list(scrapers)
+    elif platform in scrapers:
+        platforms = [platform]
+    else:
         print(f"❌ Unknown platform: {platform}")
-        print(f"Available platforms: {', '.join(scrapers.keys())}")
+        print(f"Available platforms: {', '.join(scrapers.keys())}, all")
         sys.exit(1)
 
-    scraper = scrapers[platform](db)
-    logger.info(f"Scraping {platform}...")
+    logger.info(f"Scraping {', '.join(platforms)}...")
 
-    log = scraper.run()
+    with ExitStack() as stack:
+        instances = [stack.enter_context(scrapers[name](db)) for name in platforms]
+        logs = list(run_scrapers(instances))
 
-    if log.success:
-        print(f"\n✅ Scrape complete!")
-        print(f"  Found: {log.programs_found}")
-        print(f"  New: {log.programs_new}")
-        print(f"  Updated: {log.programs_updated}")
-
-        # Send notification if configured
-        if args.notify and (log.programs_new > 0 or log.programs_updated > 0):
-            notifier = DiscordNotifier()
-            notifier.send_batch_summary(log.programs_new, log.programs_updated, platform)
-    else:
-        print(f"\n❌ Scrape failed: {log.error_message}")
+    failed = False
+    for log in logs:
+        if log.success and log.unchanged:
+            print(f"\n✅ Unchanged since the last scrape: {log.platform}")
+        elif log.success:
+            print(f"\n✅ Scrape complete: {log.platform}")
+            print(f"  Found: {log.programs_found}")
+            print(f"  New: {log.programs_new}")
+            print(f"  Updated: {log.programs_updated}")
+
+            # Send notification if configured
+            if args.notify and (log.programs_new > 0 or log.programs_updated > 0):
+                with DiscordNotifier() as notifier:
+                    notifier.send_batch_summary(log.programs_new, log.programs_updated, log.platform)
+        else:
+            print(f"\n❌ Scrape failed: {log.platform}: {log.error_message}")
+            failed = True
+
+    if failed:
         sys.exit(1)
 
 
@@ -131,7 +147,10 @@ def cmd_logs(args):
     for log in logs:
         status = "✅" if log['success'] else "❌"
         print(f"\n{status} {log['platform']} - {log['started_at']}")
-        print(f"   Found: {log['programs_found']} | New: {log['programs_new']} | Updated: {log['programs_updated']}")
+        if log['unchanged']:
+            print("   Unchanged since the previous scrape")
+        else:
+            print(f"   Found: {log['programs_found']} | New: {log['programs_new']} | Updated: {log['programs_updated']}")
         if log['error_message']:
             print(f"   Error: {log['error_message']}")
 
@@ -147,7 +166,7 @@ def main():
 
     # Scrape command
     scrape_parser = subparsers.add_parser('scrape', help='Scrape a platform')
-    scrape_parser.add_argument('platform', help='Platform to scrape (hackerone, projectdiscovery, etc.)')
+    scrape_parser.add_argument('platform', help='Platform to scrape (hackerone, projectdiscovery, etc.), or all')
     scrape_parser.add_argument('--notify', action='store_true', help='Send Discord notification')
 
     # Stats command
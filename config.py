@@ -14,7 +14,7 @@ DB_PATH = os.environ.get("DB_PATH", str(BASE_DIR / "bountyping.db"))
 # Scraping settings
 SCRAPE_INTERVAL_MINUTES = int(os.environ.get("SCRAPE_INTERVAL_MINUTES", 60))
 USER_AGENT = "BountyPing/0.1 (Bug Bounty Aggregator; +https://bountyping.com)"
-REQUEST_DELAY = float(os.environ.get("REQUEST_DELAY", 1.0))  # seconds between requests
+REQUEST_DELAY = float(os.environ.get("REQUEST_DELAY", 1.0))  # seconds between requests to the same host
 
 # Notifications
 DISCORD_WEBHOOK_URL = os.environ.get("DISCORD_WEBHOOK_URL", "")
@@ -2,32 +2,282 @@
 SQLite database operations for BountyPing
 """
 
+import hashlib
 import json
+import queue
+import re
 import sqlite3
-from datetime import datetime
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+import orjson
 
 from .models import Program, ScrapeLog
 
+# Number of pooled read connections per database
+READER_POOL_SIZE = 4
+
+# Applied to every connection when it is opened. WAL lets the readers run
+# alongside the writer; synchronous=NORMAL only fsyncs at checkpoints.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-1048576",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+)
+
+# Lower bound for "new this week", in the same ISO format as first_seen so
+# the comparison can be answered from the first_seen indexes
+NEW_PROGRAM_CUTOFF = "strftime('%Y-%m-%dT%H:%M:%S', 'now', '-7 days')"
+
+# Columns of the programs table, in insert order (raw_data lives in program_raw)
+PROGRAM_COLUMNS = (
+    "id, platform, name, slug, url, bounty_min, bounty_max, currency, "
+    "assets, asset_types, managed, vdp_only, accepts_submissions, offers_bounties, "
+    "first_seen, last_updated, last_scraped"
+)
+
+# Columns written by upserts: the listed ones plus derived filter columns
+_WRITE_COLUMNS = PROGRAM_COLUMNS + ", asset_types_bitmap"
+
+# Bit per known asset type in asset_types_bitmap, so the asset_type filter
+# is an integer AND instead of a substring match on the JSON text
+ASSET_TYPE_BITS = {
+    'web': 1,
+    'mobile': 2,
+    'api': 4,
+}
+
+# Prepared statements kept per connection by the sqlite3 module
+STATEMENT_CACHE_SIZE = 256
+
+# Seconds a get_stats() result is reused while the data is unchanged
+STATS_CACHE_TTL = 60
+
+# The trigram full-text index needs at least this many characters to match
+MIN_FTS_SEARCH_LENGTH = 3
+
+# Stripped from search terms; FTS MATCH rejects phrases containing NUL,
+# and LIKE would stop comparing at one
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1f\x7f]')
+
+# Write statements are built once at import time. sqlite3 caches prepared
+# statements by SQL text, so each is parsed once per connection.
+
+_CREATE_BATCH_SQL = f"""
+    CREATE TEMP TABLE IF NOT EXISTS program_batch AS
+    SELECT {_WRITE_COLUMNS} FROM programs WHERE 0
+"""
+
+_CLEAR_BATCH_SQL = "DELETE FROM program_batch"
+
+_STAGE_BATCH_SQL = f"""
+    INSERT INTO program_batch ({_WRITE_COLUMNS})
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_DETECT_CHANGES_SQL = """
+    SELECT
+        b.id,
+        p.id IS NULL,
+        p.id IS NOT NULL AND (p.bounty_min, p.bounty_max, p.assets, p.url)
+            IS NOT (b.bounty_min, b.bounty_max, b.assets, b.url)
+    FROM program_batch b
+    LEFT JOIN programs p ON p.id = b.id
+"""
+
+# WHERE true disambiguates the upsert clause after a SELECT
+_UPSERT_FROM_BATCH_SQL = f"""
+    INSERT INTO programs ({_WRITE_COLUMNS})
+    SELECT {_WRITE_COLUMNS} FROM program_batch WHERE true
+    ON CONFLICT(id) DO UPDATE SET
+        name = excluded.name,
+        url = excluded.url,
+        bounty_min = excluded.bounty_min,
+        bounty_max = excluded.bounty_max,
+        currency = excluded.currency,
+        assets = excluded.assets,
+        asset_types = excluded.asset_types,
+        asset_types_bitmap = excluded.asset_types_bitmap,
+        managed = excluded.managed,
+        vdp_only = excluded.vdp_only,
+        accepts_submissions = excluded.accepts_submissions,
+        offers_bounties = excluded.offers_bounties,
+        last_updated = CASE
+            WHEN (bounty_min, bounty_max, assets, url)
+                IS NOT (excluded.bounty_min, excluded.bounty_max, excluded.assets, excluded.url)
+            THEN excluded.last_updated
+            ELSE last_updated
+        END,
+        last_scraped = excluded.last_scraped
+"""
+
+_UPSERT_RAW_SQL = """
+    INSERT INTO program_raw (id, raw_hash, raw_data) VALUES (?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        raw_hash = excluded.raw_hash,
+        raw_data = excluded.raw_data
+    WHERE raw_hash IS NOT excluded.raw_hash
+"""
+
+# Fixed text, so it stays prepared; served by idx_platform_firstseen
+_RECENT_NEW_PROGRAMS_SQL = f"""
+    SELECT {PROGRAM_COLUMNS} FROM programs
+    WHERE platform = ? AND first_seen >= {NEW_PROGRAM_CUTOFF}
+    ORDER BY first_seen DESC
+    LIMIT ?
+"""
+
+_INSERT_SCRAPE_LOG_SQL = """
+    INSERT INTO scrape_logs (
+        platform, started_at, completed_at,
+        programs_found, programs_new, programs_updated,
+        success, error_message, full_scan, unchanged
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_LAST_SCRAPE_SQL = """
+    SELECT started_at FROM scrape_logs
+    WHERE platform = ? AND success = 1
+    ORDER BY started_at DESC
+    LIMIT 1
+"""
+
+_LAST_FULL_SCRAPE_SQL = """
+    SELECT started_at FROM scrape_logs
+    WHERE platform = ? AND success = 1 AND full_scan = 1
+    ORDER BY started_at DESC
+    LIMIT 1
+"""
+
 
 class BountyDatabase:
-    """Handles all database operations"""
+    """
+    Handles all database operations.
 
-    def __init__(self, db_path: str):
+    Keeps one long-lived writer connection (serialized by a lock) and a
+    small pool of reader connections, instead of reconnecting per call.
+    """
+
+    def __init__(self, db_path: str, readers: int = READER_POOL_SIZE):
         self.db_path = db_path
+
+        self._write_lock = threading.Lock()
+        self._writer = self.get_connection()
         self.init_db()
 
-    def get_connection(self):
-        """Get a database connection"""
-        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        self._readers: queue.Queue[sqlite3.Connection] = queue.Queue()
+        for _ in range(readers):
+            self._readers.put(self.get_connection(query_only=True))
+
+        # Dedicated connection for PRAGMA data_version, which changes whenever
+        # any other connection (in this process or another) commits
+        self._monitor_lock = threading.Lock()
+        self._monitor = self.get_connection(query_only=True)
+
+        self._stats_cache: Optional[tuple[float, int, dict]] = None
+        self.stats_cache_hits = 0
+        self.stats_cache_misses = 0
+
+    def get_connection(self, query_only: bool = False):
+        """
+        Get a database connection.
+        query_only connections refuse writes, so a reader can never take
+        the write lock away from the writer.
+        """
+        # timeout doubles as the busy timeout for locked databases
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=30.0,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
         conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        if query_only:
+            conn.execute("PRAGMA query_only=1")
         return conn
 
+    @contextmanager
+    def _read(self):
+        """Borrow a reader connection from the pool"""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    @contextmanager
+    def _write(self):
+        """Hold the writer connection; commits on success, rolls back on error"""
+        with self._write_lock:
+            conn = self._writer
+            # Take the write lock up front rather than upgrading mid-transaction
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def close(self):
+        """Close all pooled connections"""
+        with self._write_lock:
+            self._writer.close()
+        with self._monitor_lock:
+            self._monitor.close()
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
+
+    def data_version(self) -> int:
+        """Token that changes whenever the database contents change"""
+        with self._monitor_lock:
+            return self._monitor.execute("PRAGMA data_version").fetchone()[0]
+
     def init_db(self):
-        """Initialize database schema"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        """Initialize database schema, applying any pending migrations"""
+        migrations = self._migrations()
+
+        # PRAGMA user_version counts applied migrations, so an up-to-date
+        # database costs one header read instead of a DDL transaction
+        if self._schema_version(self._writer) >= len(migrations):
+            return
+
+        with self._write() as conn:
+            cursor = conn.cursor()
+            version = self._schema_version(conn)
+            for number, migrate in enumerate(migrations[version:], start=version + 1):
+                migrate(cursor)
+                cursor.execute(f"PRAGMA user_version = {number}")
+
+    def _schema_version(self, conn: sqlite3.Connection) -> int:
+        """Number of schema migrations applied to the database"""
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def _migrations(self) -> list:
+        """Schema migrations, in the order they must be applied"""
+        return [
+            self._create_schema,
+            self._add_search_indexes,
+            self._split_raw_data,
+            self._add_asset_type_bitmap,
+            self._add_stats_counters,
+            self._add_scrape_log_full_scan,
+            self._add_kv_cache,
+            self._add_scrape_log_unchanged,
+        ]
+
+    def _create_schema(self, cursor: sqlite3.Cursor):
+        """Create tables and indexes if they don't exist"""
 
         # Programs table
         cursor.execute("""
@@ -80,118 +330,240 @@ class BountyDatabase:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_first_seen ON programs(first_seen)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_bounty_max ON programs(bounty_max)")
 
-        conn.commit()
-        conn.close()
+    def _add_search_indexes(self, cursor: sqlite3.Cursor):
+        """Add composite/partial indexes and a full-text index on name and slug"""
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_platform_firstseen ON programs(platform, first_seen DESC)")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_new_paid ON programs(first_seen DESC)
+            WHERE vdp_only = 0 AND offers_bounties = 1
+        """)
+
+        # Trigram tokens give substring matches, like the LIKE '%term%' they replace
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS programs_fts USING fts5(
+                id UNINDEXED, name, slug, tokenize = 'trigram'
+            )
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS programs_fts_insert AFTER INSERT ON programs BEGIN
+                INSERT INTO programs_fts (id, name, slug) VALUES (new.id, new.name, new.slug);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS programs_fts_update AFTER UPDATE OF name, slug ON programs
+            WHEN old.name IS NOT new.name OR old.slug IS NOT new.slug BEGIN
+                UPDATE programs_fts SET name = new.name, slug = new.slug WHERE id = old.id;
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS programs_fts_delete AFTER DELETE ON programs BEGIN
+                DELETE FROM programs_fts WHERE id = old.id;
+            END
+        """)
+        cursor.execute("INSERT INTO programs_fts (id, name, slug) SELECT id, name, slug FROM programs")
+
+    def _split_raw_data(self, cursor: sqlite3.Cursor):
+        """Move raw_data out of the programs table, keyed by a content hash"""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS program_raw (
+                id TEXT PRIMARY KEY REFERENCES programs(id) ON DELETE CASCADE,
+                raw_hash TEXT,
+                raw_data TEXT
+            )
+        """)
+        cursor.execute("""
+            INSERT OR IGNORE INTO program_raw (id, raw_data)
+            SELECT id, raw_data FROM programs WHERE raw_data IS NOT NULL
+        """)
+        cursor.execute("ALTER TABLE programs DROP COLUMN raw_data")
+
+    def _add_asset_type_bitmap(self, cursor: sqlite3.Cursor):
+        """Add the asset_types_bitmap filter column and a platform/bounty index"""
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_platform_bounty ON programs(platform, bounty_max DESC)")
+        cursor.execute("ALTER TABLE programs ADD COLUMN asset_types_bitmap INTEGER NOT NULL DEFAULT 0")
+
+        # Each type maps to a distinct bit, so summing distinct bits ORs them
+        bits = " ".join(f"WHEN '{name}' THEN {bit}" for name, bit in ASSET_TYPE_BITS.items())
+        cursor.execute(f"""
+            UPDATE programs SET asset_types_bitmap = (
+                SELECT COALESCE(SUM(DISTINCT CASE value {bits} END), 0)
+                FROM json_each(asset_types)
+            )
+        """)
+
+    def _add_stats_counters(self, cursor: sqlite3.Cursor):
+        """
+        Keep per-platform and overall counts in tables maintained by
+        triggers, so get_stats() reads a few rows instead of aggregating.
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS platform_counts (
+                platform TEXT PRIMARY KEY,
+                n INTEGER NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS stats_kv (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS programs_stats_insert AFTER INSERT ON programs BEGIN
+                INSERT INTO platform_counts (platform, n) VALUES (new.platform, 1)
+                    ON CONFLICT(platform) DO UPDATE SET n = n + 1;
+                UPDATE stats_kv SET value = value + 1 WHERE key = 'total_programs';
+                UPDATE stats_kv SET value = value + (new.vdp_only = 0 AND new.offers_bounties = 1)
+                    WHERE key = 'paid_programs';
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS programs_stats_update AFTER UPDATE OF vdp_only, offers_bounties ON programs
+            WHEN old.vdp_only IS NOT new.vdp_only OR old.offers_bounties IS NOT new.offers_bounties BEGIN
+                UPDATE stats_kv SET value = value
+                    + (new.vdp_only = 0 AND new.offers_bounties = 1)
+                    - (old.vdp_only = 0 AND old.offers_bounties = 1)
+                    WHERE key = 'paid_programs';
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS programs_stats_delete AFTER DELETE ON programs BEGIN
+                UPDATE platform_counts SET n = n - 1 WHERE platform = old.platform;
+                DELETE FROM platform_counts WHERE platform = old.platform AND n <= 0;
+                UPDATE stats_kv SET value = value - 1 WHERE key = 'total_programs';
+                UPDATE stats_kv SET value = value - (old.vdp_only = 0 AND old.offers_bounties = 1)
+                    WHERE key = 'paid_programs';
+            END
+        """)
+
+        # Seed the counters from the existing rows
+        cursor.execute("""
+            INSERT OR REPLACE INTO platform_counts (platform, n)
+            SELECT platform, COUNT(*) FROM programs GROUP BY platform
+        """)
+        cursor.execute("""
+            INSERT OR REPLACE INTO stats_kv (key, value)
+            SELECT 'total_programs', COUNT(*) FROM programs
+            UNION ALL
+            SELECT 'paid_programs', COUNT(*) FROM programs WHERE vdp_only = 0 AND offers_bounties = 1
+        """)
+
+    def _add_scrape_log_full_scan(self, cursor: sqlite3.Cursor):
+        """Record whether each scrape covered the whole platform or just changes"""
+        cursor.execute("ALTER TABLE scrape_logs ADD COLUMN full_scan INTEGER DEFAULT 1")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_scrape_logs_platform ON scrape_logs(platform, started_at DESC)")
+
+    def _add_kv_cache(self, cursor: sqlite3.Cursor):
+        """Small key/value store for scraper state such as HTTP validators"""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS kv_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        """)
+
+    def _add_scrape_log_unchanged(self, cursor: sqlite3.Cursor):
+        """Record scrapes that found their source unchanged and parsed nothing"""
+        cursor.execute("ALTER TABLE scrape_logs ADD COLUMN unchanged INTEGER DEFAULT 0")
 
     def upsert_program(self, program: Program) -> tuple[bool, bool]:
         """
         Insert or update a program.
         Returns (is_new, is_updated)
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        now = datetime.utcnow().isoformat()
-
-        # Check if program exists
-        cursor.execute("SELECT * FROM programs WHERE id = ?", (program.id,))
-        existing = cursor.fetchone()
-
-        is_new = existing is None
-        is_updated = False
-
-        if is_new:
-            # New program
-            program.first_seen = datetime.utcnow()
-            program.last_updated = datetime.utcnow()
-            program.last_scraped = datetime.utcnow()
-
-            cursor.execute("""
-                INSERT INTO programs (
-                    id, platform, name, slug, url,
-                    bounty_min, bounty_max, currency,
-                    assets, asset_types, managed, vdp_only,
-                    accepts_submissions, offers_bounties,
-                    first_seen, last_updated, last_scraped,
-                    raw_data
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                program.id, program.platform, program.name, program.slug, program.url,
-                program.bounty_min, program.bounty_max, program.currency,
-                json.dumps(program.assets), json.dumps(program.asset_types),
-                int(program.managed), int(program.vdp_only),
-                int(program.accepts_submissions), int(program.offers_bounties),
-                program.first_seen.isoformat() if program.first_seen else now,
-                program.last_updated.isoformat() if program.last_updated else now,
-                program.last_scraped.isoformat() if program.last_scraped else now,
-                json.dumps(program.raw_data) if program.raw_data else None
-            ))
+        return self.upsert_programs([program])[0]
 
-        else:
-            # Existing program - check if anything changed
-            old_data = {
-                'bounty_min': existing['bounty_min'],
-                'bounty_max': existing['bounty_max'],
-                'assets': existing['assets'],
-                'url': existing['url']
-            }
-
-            new_data = {
-                'bounty_min': program.bounty_min,
-                'bounty_max': program.bounty_max,
-                'assets': json.dumps(program.assets),
-                'url': program.url
-            }
-
-            is_updated = old_data != new_data
-
-            # Update with latest data
-            cursor.execute("""
-                UPDATE programs SET
-                    name = ?,
-                    url = ?,
-                    bounty_min = ?,
-                    bounty_max = ?,
-                    currency = ?,
-                    assets = ?,
-                    asset_types = ?,
-                    managed = ?,
-                    vdp_only = ?,
-                    accepts_submissions = ?,
-                    offers_bounties = ?,
-                    last_updated = ?,
-                    last_scraped = ?,
-                    raw_data = ?
-                WHERE id = ?
-            """, (
-                program.name,
-                program.url,
-                program.bounty_min,
-                program.bounty_max,
-                program.currency,
-                json.dumps(program.assets),
-                json.dumps(program.asset_types),
-                int(program.managed),
-                int(program.vdp_only),
-                int(program.accepts_submissions),
-                int(program.offers_bounties),
-                now if is_updated else existing['last_updated'],
-                now,
-                json.dumps(program.raw_data) if program.raw_data else None,
-                program.id
-            ))
+    def upsert_programs(self, programs: list[Program]) -> list[tuple[bool, bool]]:
+        """
+        Insert or update a batch of programs in a single transaction.
+        Returns (is_new, is_updated) for each program, in order; a repeated
+        id is reported at its first occurrence and as (False, False) after.
+        """
+        if not programs:
+            return []
 
-        conn.commit()
-        conn.close()
+        # A source can list the same program twice; the last copy wins, as
+        # it would have with one upsert per program
+        unique = list({program.id: program for program in programs}.values())
 
-        return is_new, is_updated
+        # One timestamp for the whole batch
+        now = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        rows = [self._program_row(program, now) for program in unique]
+        raw_rows = [self._raw_data_row(program) for program in unique]
+
+        with self._write() as conn:
+            cursor = conn.cursor()
+
+            # Stage the batch in a temp table so change detection runs inside
+            # SQLite and only two booleans per program come back to Python
+            cursor.execute(_CREATE_BATCH_SQL)
+            cursor.execute(_CLEAR_BATCH_SQL)
+            cursor.executemany(_STAGE_BATCH_SQL, rows)
+
+            cursor.execute(_DETECT_CHANGES_SQL)
+            changes = {row[0]: (bool(row[1]), bool(row[2])) for row in cursor.fetchall()}
+
+            cursor.execute(_UPSERT_FROM_BATCH_SQL)
+            cursor.execute(_CLEAR_BATCH_SQL)
+            self._upsert_raw_data(cursor, raw_rows)
+
+        # Report each id once, at its first position; repeats changed nothing
+        results = []
+        for program in programs:
+            results.append(changes.pop(program.id, (False, False)))
+        return results
+
+    def _program_row(self, program: Program, now: str) -> tuple:
+        """
+        Serialize a program into an INSERT parameter tuple.
+        bool is an int subclass, so sqlite3 binds the flags as 0/1 itself.
+        """
+        return (
+            program.id, program.platform, program.name, program.slug, program.url,
+            program.bounty_min, program.bounty_max, program.currency,
+            json.dumps(program.assets), json.dumps(program.asset_types),
+            program.managed, program.vdp_only,
+            program.accepts_submissions, program.offers_bounties,
+            program.first_seen.isoformat() if program.first_seen else now,
+            now,
+            now,
+            self._asset_types_bitmap(program.asset_types)
+        )
+
+    def _asset_types_bitmap(self, asset_types: list) -> int:
+        """Combine the ASSET_TYPE_BITS of the known asset types"""
+        bitmap = 0
+        for asset_type in asset_types:
+            bitmap |= ASSET_TYPE_BITS.get(asset_type, 0)
+        return bitmap
+
+    def _raw_data_row(self, program: Program) -> tuple:
+        """Serialize a program's raw data with its content hash"""
+        if not program.raw_data:
+            return (program.id, None, None)
+
+        raw_json = json.dumps(program.raw_data)
+        raw_hash = hashlib.blake2b(raw_json.encode(), digest_size=16).hexdigest()
+        return (program.id, raw_hash, raw_json)
+
+    def _upsert_raw_data(self, cursor: sqlite3.Cursor, raw_rows: list[tuple]):
+        """Store raw data, skipping the write when the content hash is unchanged"""
+        cursor.executemany(_UPSERT_RAW_SQL, raw_rows)
 
     def get_all_programs(self, filters: Optional[dict] = None) -> list[dict]:
         """Get all programs with optional filters"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        return list(self.iter_programs(filters))
+
+    def iter_programs(self, filters: Optional[dict] = None) -> Iterator[dict]:
+        """
+        Yield programs matching the filters one at a time.
+        Pass include_raw=True in filters to also load raw_data.
+        """
+        columns = PROGRAM_COLUMNS
+        if filters and filters.get('include_raw'):
+            columns += ", (SELECT raw_data FROM program_raw WHERE program_raw.id = programs.id) AS raw_data"
 
-        query = "SELECT * FROM programs WHERE 1=1"
+        query = f"SELECT {columns} FROM programs WHERE 1=1"
         params = []
 
         if filters:
@@ -204,15 +576,24 @@ class BountyDatabase:
                 params.append(min_bounty)
 
             if asset_type := filters.get('asset_type'):
-                query += " AND asset_types LIKE ?"
-                params.append(f'%{asset_type}%')
+                if asset_type in ASSET_TYPE_BITS:
+                    query += " AND asset_types_bitmap & ? != 0"
+                    params.append(ASSET_TYPE_BITS[asset_type])
+                else:
+                    query += " AND asset_types LIKE ?"
+                    params.append(f'%{asset_type}%')
 
             if search := filters.get('search'):
-                query += " AND (name LIKE ? OR slug LIKE ?)"
-                params.extend([f'%{search}%', f'%{search}%'])
+                term = _CONTROL_CHARS_RE.sub('', search)
+                if len(term) >= MIN_FTS_SEARCH_LENGTH:
+                    query += " AND id IN (SELECT id FROM programs_fts WHERE programs_fts MATCH ?)"
+                    params.append('"{}"'.format(term.replace('"', '""')))
+                else:
+                    query += " AND (name LIKE ? OR slug LIKE ?)"
+                    params.extend([f'%{term}%', f'%{term}%'])
 
             if filters.get('new_only'):
-                query += " AND datetime(first_seen) >= datetime('now', '-7 days')"
+                query += f" AND first_seen >= {NEW_PROGRAM_CUTOFF}"
 
             if filters.get('bounties_only'):
                 query += " AND vdp_only = 0 AND offers_bounties = 1"
@@ -226,87 +607,140 @@ class BountyDatabase:
         elif sort_by == 'name':
             query += " ORDER BY name ASC"
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-
-        programs = []
-        for row in rows:
-            program_dict = dict(row)
-            # Parse JSON fields
-            program_dict['assets'] = json.loads(program_dict.get('assets', '[]'))
-            program_dict['asset_types'] = json.loads(program_dict.get('asset_types', '[]'))
-            program_dict['raw_data'] = json.loads(program_dict['raw_data']) if program_dict.get('raw_data') else None
-            programs.append(program_dict)
-
-        conn.close()
-        return programs
+        if filters and (limit := filters.get('limit')):
+            query += " LIMIT ?"
+            params.append(limit)
+
+        yield from self._query_programs(query, params)
+
+    def recent_new_programs(self, platform: str, limit: int = 5) -> list[dict]:
+        """Newest programs first seen on a platform in the last 7 days"""
+        return list(self._query_programs(_RECENT_NEW_PROGRAMS_SQL, (platform, limit)))
+
+    def _query_programs(self, query: str, params) -> Iterator[dict]:
+        """Run a programs query and yield rows as dicts with JSON fields decoded"""
+        with self._read() as conn:
+            # Plain tuples zipped with column names read once per query are
+            # cheaper than building each dict through sqlite3.Row
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(query, params)
+            columns = [description[0] for description in cursor.description]
+            include_raw = 'raw_data' in columns
+            loads = orjson.loads
+
+            for row in cursor:
+                program_dict = dict(zip(columns, row))
+                # Parse JSON fields
+                program_dict['assets'] = loads(program_dict['assets'])
+                program_dict['asset_types'] = loads(program_dict['asset_types'])
+                if include_raw:
+                    raw_data = program_dict['raw_data']
+                    program_dict['raw_data'] = loads(raw_data) if raw_data else None
+                yield program_dict
 
     def get_stats(self) -> dict:
-        """Get database statistics"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT COUNT(*) as total FROM programs")
-        total = cursor.fetchone()['total']
+        """
+        Get database statistics.
+        Results are cached for STATS_CACHE_TTL seconds, or until the data changes.
+        """
+        version = self.data_version()
+        cached = self._stats_cache
+        if cached and cached[1] == version and time.monotonic() - cached[0] < STATS_CACHE_TTL:
+            self.stats_cache_hits += 1
+            return cached[2]
 
-        cursor.execute("SELECT COUNT(*) as new FROM programs WHERE datetime(first_seen) >= datetime('now', '-7 days')")
-        new_this_week = cursor.fetchone()['new']
+        self.stats_cache_misses += 1
+        stats = self._compute_stats()
+        self._stats_cache = (time.monotonic(), version, stats)
+        return stats
 
-        cursor.execute("SELECT COUNT(*) as paid FROM programs WHERE vdp_only = 0 AND offers_bounties = 1")
-        paid_programs = cursor.fetchone()['paid']
+    def _compute_stats(self) -> dict:
+        """Read the counters behind get_stats()"""
+        with self._read() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("SELECT COUNT(DISTINCT platform) as platforms FROM programs")
-        platforms = cursor.fetchone()['platforms']
+            cursor.execute("SELECT key, value FROM stats_kv")
+            counters = {row['key']: row['value'] for row in cursor.fetchall()}
 
-        cursor.execute("SELECT platform, COUNT(*) as count FROM programs GROUP BY platform ORDER BY count DESC")
-        by_platform = {row['platform']: row['count'] for row in cursor.fetchall()}
+            # The 7-day window moves with the clock, so this one can't be a
+            # stored counter; it is a range count on idx_first_seen instead
+            cursor.execute(f"SELECT COUNT(*) as new FROM programs WHERE first_seen >= {NEW_PROGRAM_CUTOFF}")
+            new_this_week = cursor.fetchone()['new']
 
-        conn.close()
+            cursor.execute("SELECT platform, n FROM platform_counts ORDER BY n DESC")
+            by_platform = {row['platform']: row['n'] for row in cursor.fetchall()}
 
         return {
-            'total_programs': total,
+            'total_programs': counters.get('total_programs', 0),
             'new_this_week': new_this_week,
-            'paid_programs': paid_programs,
-            'platforms': platforms,
+            'paid_programs': counters.get('paid_programs', 0),
+            'platforms': len(by_platform),
             'by_platform': by_platform
         }
 
+    def total_programs(self) -> int:
+        """Number of programs stored, read from the maintained counter"""
+        with self._read() as conn:
+            row = conn.execute("SELECT value FROM stats_kv WHERE key = 'total_programs'").fetchone()
+
+        return row['value'] if row else 0
+
     def log_scrape(self, log: ScrapeLog):
         """Log a scraping operation"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        with self._write() as conn:
+            conn.execute(_INSERT_SCRAPE_LOG_SQL, (
+                log.platform,
+                log.started_at.isoformat() if log.started_at else None,
+                log.completed_at.isoformat() if log.completed_at else None,
+                log.programs_found,
+                log.programs_new,
+                log.programs_updated,
+                log.success,
+                log.error_message,
+                log.full_scan,
+                log.unchanged
+            ))
 
-        cursor.execute("""
-            INSERT INTO scrape_logs (
-                platform, started_at, completed_at,
-                programs_found, programs_new, programs_updated,
-                success, error_message
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            log.platform,
-            log.started_at.isoformat() if log.started_at else None,
-            log.completed_at.isoformat() if log.completed_at else None,
-            log.programs_found,
-            log.programs_new,
-            log.programs_updated,
-            int(log.success),
-            log.error_message
-        ))
-
-        conn.commit()
-        conn.close()
+    def last_scrape_at(self, platform: str, full_scan: bool = False) -> Optional[datetime]:
+        """
+        Start time of the platform's latest successful scrape.
+        With full_scan=True, only scrapes that covered the whole platform count.
+        """
+        query = _LAST_FULL_SCRAPE_SQL if full_scan else _LAST_SCRAPE_SQL
+        with self._read() as conn:
+            row = conn.execute(query, (platform,)).fetchone()
+
+        if not row or not row['started_at']:
+            return None
+
+        started_at = datetime.fromisoformat(row['started_at'])
+        if started_at.tzinfo is None:
+            started_at = started_at.replace(tzinfo=timezone.utc)
+        return started_at
+
+    def get_kv(self, key: str) -> Optional[dict]:
+        """Get a value stored with set_kv()"""
+        with self._read() as conn:
+            row = conn.execute("SELECT value FROM kv_cache WHERE key = ?", (key,)).fetchone()
+
+        return json.loads(row['value']) if row else None
+
+    def set_kv(self, key: str, value: dict):
+        """Store a JSON-serializable value under key, replacing any previous one"""
+        with self._write() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO kv_cache (key, value) VALUES (?, ?)",
+                (key, json.dumps(value))
+            )
 
     def get_recent_logs(self, limit: int = 20) -> list[dict]:
         """Get recent scrape logs"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT * FROM scrape_logs
-            ORDER BY started_at DESC
-            LIMIT ?
-        """, (limit,))
-
-        logs = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return logs
+        with self._read() as conn:
+            rows = conn.execute("""
+                SELECT * FROM scrape_logs
+                ORDER BY started_at DESC
+                LIMIT ?
+            """, (limit,)).fetchall()
+
+        return [dict(row) for row in rows]
@@ -2,14 +2,19 @@
 Database models for BountyPing
 """
 
-from dataclasses import dataclass, field
-from datetime import datetime
+import hashlib
+import sys
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Program:
-    """Bug bounty program model"""
+    """
+    Bug bounty program model.
+    Slotted, since scrapes hold thousands of these at once.
+    """
 
     # Core identification
     id: str  # unique hash of platform + program name
@@ -44,10 +49,34 @@ class Program:
     def __post_init__(self):
         """Generate ID if not provided"""
         if not self.id:
-            # Create deterministic ID from platform + slug
-            import hashlib
+            # Create deterministic ID from platform + slug. This is a lookup
+            # key, not a security boundary, and existing rows are keyed by it.
             key = f"{self.platform}:{self.slug}".lower()
-            self.id = hashlib.md5(key.encode()).hexdigest()[:16]
+            self.id = hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()[:16]
+
+        # Only a handful of distinct values, so every program can share them
+        self.platform = sys.intern(self.platform)
+        if self.currency:
+            self.currency = sys.intern(self.currency)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Program':
+        """Build a Program from a row dict returned by BountyDatabase"""
+        values = {f.name: data[f.name] for f in fields(cls) if f.name in data}
+
+        for key in ('managed', 'vdp_only', 'accepts_submissions', 'offers_bounties'):
+            if key in values:
+                values[key] = bool(values[key])
+
+        for key in ('first_seen', 'last_updated', 'last_scraped'):
+            if values.get(key):
+                timestamp = datetime.fromisoformat(values[key])
+                # Rows written before timestamps carried an offset are UTC
+                if timestamp.tzinfo is None:
+                    timestamp = timestamp.replace(tzinfo=timezone.utc)
+                values[key] = timestamp
+
+        return cls(**values)
 
     @property
     def bounty_range(self) -> str:
@@ -70,8 +99,10 @@ class Program:
         if not self.first_seen:
             return False
 
-        from datetime import timedelta
-        return (datetime.utcnow() - self.first_seen) < timedelta(days=7)
+        first_seen = self.first_seen
+        if first_seen.tzinfo is None:
+            first_seen = first_seen.replace(tzinfo=timezone.utc)
+        return (datetime.now(timezone.utc) - first_seen) < timedelta(days=7)
 
 
 @dataclass
@@ -86,3 +117,5 @@ class ScrapeLog:
     programs_updated: int = 0
     success: bool = True
     error_message: Optional[str] = None
+    full_scan: bool = True  # False when only changes since the last scrape were fetched
+    unchanged: bool = False  # source reported no changes (e.g. HTTP 304), so nothing was parsed
@@ -0,0 +1,35 @@
+"""
+Gunicorn configuration for BountyPing
+
+Serves the Flask app with a threaded worker and runs the background
+scheduler inside it, replacing the single-threaded dev server in run.py.
+
+    gunicorn -c gunicorn.conf.py web.app:app
+"""
+
+from config import FLASK_HOST, FLASK_PORT
+
+bind = f"{FLASK_HOST}:{FLASK_PORT}"
+
+# One worker, so the scheduler (started in it below) only scrapes once;
+# routes are mostly waiting on SQLite, so threads give the concurrency
+workers = 1
+worker_class = "gthread"
+threads = 8
+
+_scheduler = None
+
+
+def post_worker_init(worker):
+    """Start the background scraping loop in the worker"""
+    global _scheduler
+    from scheduler import BountyPingScheduler
+
+    _scheduler = BountyPingScheduler()
+    _scheduler.start_background_loop()
+
+
+def worker_exit(server, worker):
+    """Stop the scraping loop, letting an in-progress scrape finish briefly"""
+    if _scheduler is not None:
+        _scheduler.stop(timeout=10)
@@ -7,16 +7,32 @@ import requests
 from typing import Optional
 
 from db.models import Program
-from config import DISCORD_WEBHOOK_URL
+from config import DISCORD_WEBHOOK_URL, USER_AGENT
 
 logger = logging.getLogger(__name__)
 
+# Discord accepts at most this many embeds in one webhook message
+MAX_EMBEDS_PER_MESSAGE = 10
+
 
 class DiscordNotifier:
     """Send notifications via Discord webhook"""
 
     def __init__(self, webhook_url: Optional[str] = None):
         self.webhook_url = webhook_url or DISCORD_WEBHOOK_URL
+        # Reuse one connection pool so repeated webhooks skip the TLS handshake
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': USER_AGENT})
+
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def send_new_program(self, program: Program) -> bool:
         """Notify about a new bug bounty program"""
@@ -24,7 +40,33 @@ class DiscordNotifier:
             logger.warning("Discord webhook URL not configured")
             return False
 
-        # Build embed
+        payload = {
+            "embeds": [self._new_program_embed(program)]
+        }
+
+        return self._send_webhook(payload)
+
+    def send_new_programs(self, programs: list[Program]) -> bool:
+        """
+        Notify about several new programs, packing up to ten embeds
+        into each webhook message instead of one message per program.
+        """
+        if not self.webhook_url:
+            logger.warning("Discord webhook URL not configured")
+            return False
+
+        success = True
+        for i in range(0, len(programs), MAX_EMBEDS_PER_MESSAGE):
+            chunk = programs[i:i + MAX_EMBEDS_PER_MESSAGE]
+            payload = {
+                "embeds": [self._new_program_embed(program) for program in chunk]
+            }
+            success = self._send_webhook(payload) and success
+
+        return success
+
+    def _new_program_embed(self, program: Program) -> dict:
+        """Build the embed announcing a new program"""
         embed = {
             "title": f"🆕 New Bug Bounty: {program.name}",
             "url": program.url,
@@ -65,11 +107,7 @@ class DiscordNotifier:
                 "inline": False
             })
 
-        payload = {
-            "embeds": [embed]
-        }
-
-        return self._send_webhook(payload)
+        return embed
 
     def send_updated_program(self, program: Program) -> bool:
         """Notify about an updated program"""
@@ -123,7 +161,7 @@ class DiscordNotifier:
     def _send_webhook(self, payload: dict) -> bool:
         """Send payload to Discord webhook"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.webhook_url,
                 json=payload,
                 timeout=10
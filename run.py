@@ -2,7 +2,8 @@
 """
 BountyPing - Main runner
 
-Starts both the web app and the background scheduler.
+Starts both the web app and the background scheduler, using Flask's
+development server. Production deployments use gunicorn.conf.py instead.
 """
 
 import logging
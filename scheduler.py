@@ -8,9 +8,12 @@ import logging
 import time
 import threading
 from datetime import datetime
+from typing import Optional
 
 from config import DB_PATH, SCRAPE_INTERVAL_MINUTES
 from db.database import BountyDatabase
+from db.models import Program, ScrapeLog
+from scrapers.base import run_scrapers
 from scrapers.hackerone import HackerOneScraper
 from scrapers.projectdiscovery import ProjectDiscoveryScraper
 from notifiers.discord import DiscordNotifier
@@ -32,7 +35,13 @@ class BountyPingScheduler:
             'hackerone': HackerOneScraper(self.db),
             # Add more scrapers here as they're implemented
         }
-        self.running = False
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        """Is the background loop active?"""
+        return self._thread is not None and self._thread.is_alive() and not self._stop.is_set()
 
     def run_scraper(self, platform: str):
         """Run a specific scraper and send notifications"""
@@ -43,13 +52,14 @@ class BountyPingScheduler:
         scraper = self.scrapers[platform]
         logger.info(f"Running {platform} scraper...")
 
-        # Get programs before scraping to track changes
-        before_stats = self.db.get_stats()
-
-        # Run scraper
         log = scraper.run()
+        self.notify(log)
+        return log
+
+    def notify(self, log: ScrapeLog):
+        """Send notifications for a finished scrape"""
+        platform = log.platform
 
-        # Send notifications
         if log.success and (log.programs_new > 0 or log.programs_updated > 0):
             self.notifier.send_batch_summary(
                 log.programs_new,
@@ -60,29 +70,30 @@ class BountyPingScheduler:
             # Optionally send individual notifications for new programs
             # (Only if there aren't too many to avoid spam)
             if log.programs_new > 0 and log.programs_new <= 5:
-                # Get the new programs
-                filters = {'platform': platform, 'new_only': True}
-                new_programs = self.db.get_all_programs(filters)
+                # Newest first, so these are this run's inserts
+                new_programs = [
+                    Program.from_dict(program_dict)
+                    for program_dict in self.db.recent_new_programs(platform, limit=log.programs_new)
+                ]
 
-                for program_dict in new_programs[:5]:  # Max 5
-                    from db.models import Program
-                    # Convert dict to Program object (simplified)
-                    # In a real scenario, you'd want a proper deserialization method
-                    logger.info(f"New program: {program_dict['name']}")
-                    # notifier.send_new_program(program) - requires full Program object
+                for program in new_programs:
+                    logger.info(f"New program: {program.name}")
 
-        return log
+                # One webhook message carries all of them
+                self.notifier.send_new_programs(new_programs)
 
     def run_all_scrapers(self):
-        """Run all configured scrapers"""
+        """Run all configured scrapers concurrently"""
         logger.info("Running all scrapers")
-        for platform in self.scrapers:
-            self.run_scraper(platform)
+
+        for log in run_scrapers(list(self.scrapers.values())):
+            self.notify(log)
+
         logger.info("All scrapers complete")
 
     def start_background_loop(self):
         """Start the background scraping loop"""
-        self.running = True
+        self._stop.clear()
 
         def loop():
             logger.info(f"Starting background loop (interval: {SCRAPE_INTERVAL_MINUTES} minutes)")
@@ -90,20 +101,26 @@ class BountyPingScheduler:
             # Run immediately on startup
             self.run_all_scrapers()
 
-            while self.running:
-                time.sleep(SCRAPE_INTERVAL_MINUTES * 60)
-                if self.running:  # Check again after sleep
-                    self.run_all_scrapers()
+            # wait() returns True as soon as stop() is called, so shutdown
+            # doesn't have to sit out the rest of the interval
+            while not self._stop.wait(SCRAPE_INTERVAL_MINUTES * 60):
+                self.run_all_scrapers()
 
-        thread = threading.Thread(target=loop, daemon=True)
-        thread.start()
+        self._thread = threading.Thread(target=loop, name="bountyping-scheduler", daemon=True)
+        self._thread.start()
         logger.info("Background loop started")
 
-    def stop(self):
-        """Stop the background loop"""
-        self.running = False
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stop the background loop.
+        Waits up to timeout seconds for an in-progress scrape to finish.
+        """
+        self._stop.set()
         logger.info("Stopping scheduler")
 
+        if self._thread is not None and timeout:
+            self._thread.join(timeout)
+
 
 def main():
     """Run scheduler as standalone script"""
@@ -2,30 +2,70 @@
 Base scraper class for all bug bounty platforms
 """
 
-import time
 import logging
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional
 
+import ijson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from config import USER_AGENT, REQUEST_DELAY
+from config import USER_AGENT
 from db.models import Program, ScrapeLog
 from db.database import BountyDatabase
+from .ratelimit import limiter_for
 
 logger = logging.getLogger(__name__)
 
+# At most this many new program names go into a scrape's summary log line
+LOGGED_NEW_PROGRAMS = 25
+
+# Transient failures worth retrying, with exponential backoff (honours Retry-After)
+RETRY_POLICY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET", "POST"],
+    raise_on_status=False
+)
+
 
 class BaseScraper(ABC):
     """Base class for platform scrapers"""
 
+    # Scrapers that can fetch only recent changes set this to False for those runs
+    full_scan = True
+
     def __init__(self, db: BountyDatabase):
         self.db = db
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': USER_AGENT})
+
+        # Keep-alive pool sized for concurrent requests, plus retries
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=RETRY_POLICY)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         self.platform_name = self.get_platform_name()
 
+        # Set when a conditional fetch got 304 Not Modified during a run
+        self.unchanged = False
+        # HTTP validators from this run, saved once it succeeds
+        self._pending_validators: dict[str, dict] = {}
+
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     @abstractmethod
     def get_platform_name(self) -> str:
         """Return the platform identifier (e.g., 'hackerone', 'bugcrowd')"""
@@ -46,41 +86,68 @@ class BaseScraper(ABC):
         """
         log = ScrapeLog(
             platform=self.platform_name,
-            started_at=datetime.utcnow()
+            started_at=datetime.now(timezone.utc)
         )
 
+        self.unchanged = False
+        self._pending_validators = {}
+
         try:
-            logger.info(f"Starting scrape for {self.platform_name}")
+            logger.info("Starting scrape for %s", self.platform_name)
             programs = self.scrape_programs()
             log.programs_found = len(programs)
+            log.full_scan = self.full_scan
 
             new_count = 0
             updated_count = 0
+            new_names = []
+
+            # Per-program lines only at DEBUG; a seed can touch thousands
+            debug = logger.isEnabledFor(logging.DEBUG)
 
-            for program in programs:
-                is_new, is_updated = self.db.upsert_program(program)
+            results = self.db.upsert_programs(programs)
+            for program, (is_new, is_updated) in zip(programs, results):
                 if is_new:
                     new_count += 1
-                    logger.info(f"New program: {program.name}")
+                    if len(new_names) < LOGGED_NEW_PROGRAMS:
+                        new_names.append(program.name)
+                    if debug:
+                        logger.debug("New program: %s", program.name)
                 elif is_updated:
                     updated_count += 1
-                    logger.info(f"Updated program: {program.name}")
+                    if debug:
+                        logger.debug("Updated program: %s", program.name)
 
             log.programs_new = new_count
             log.programs_updated = updated_count
+            # Only now is the fetched content safely stored
+            for url, validators in self._pending_validators.items():
+                self.db.set_kv(f"http-validators:{url}", validators)
+
             log.success = True
-            log.completed_at = datetime.utcnow()
+            log.unchanged = self.unchanged
+            log.completed_at = datetime.now(timezone.utc)
+
+            if self.unchanged:
+                logger.info("%s unchanged since the last scrape", self.platform_name)
 
             logger.info(
-                f"Scrape complete for {self.platform_name}: "
-                f"{log.programs_found} found, {new_count} new, {updated_count} updated"
+                "Scrape complete for %s: %d found, %d new, %d updated",
+                self.platform_name, log.programs_found, new_count, updated_count
             )
+            if new_names:
+                more = new_count - len(new_names)
+                logger.info(
+                    "New programs on %s: %s%s",
+                    self.platform_name, ", ".join(new_names),
+                    f" (+{more} more)" if more else ""
+                )
 
         except Exception as e:
             log.success = False
             log.error_message = str(e)
-            log.completed_at = datetime.utcnow()
-            logger.error(f"Scrape failed for {self.platform_name}: {e}", exc_info=True)
+            log.completed_at = datetime.now(timezone.utc)
+            logger.error("Scrape failed for %s: %s", self.platform_name, e, exc_info=True)
 
         # Log to database
         self.db.log_scrape(log)
@@ -88,14 +155,80 @@ class BaseScraper(ABC):
 
     def fetch(self, url: str, **kwargs) -> requests.Response:
         """
-        Fetch a URL with polite delays.
+        Fetch a URL, rate-limited per host.
         """
-        time.sleep(REQUEST_DELAY)
+        limiter_for(url).acquire()
         response = self.session.get(url, **kwargs)
         response.raise_for_status()
         return response
 
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """
+        POST to a URL, rate-limited per host.
+        """
+        limiter_for(url).acquire()
+        response = self.session.post(url, **kwargs)
+        response.raise_for_status()
+        return response
+
     def fetch_json(self, url: str, **kwargs) -> dict:
         """Fetch JSON endpoint"""
         response = self.fetch(url, **kwargs)
         return response.json()
+
+    def fetch_json_stream(self, url: str, prefix: str, conditional: bool = False, **kwargs) -> Iterator[dict]:
+        """
+        Stream a JSON endpoint, yielding the items under prefix one at a time
+        (e.g. 'programs.item' for each element of a top-level programs array)
+        without loading the whole document.
+
+        With conditional=True, sends the ETag/Last-Modified saved by the last
+        successful run. On 304 Not Modified nothing is yielded and
+        self.unchanged is set.
+        """
+        if conditional:
+            kwargs['headers'] = {**kwargs.get('headers', {}), **self._conditional_headers(url)}
+
+        with self.fetch(url, stream=True, **kwargs) as response:
+            if response.status_code == 304:
+                self.unchanged = True
+                return
+
+            # Let urllib3 undo any gzip transfer encoding before ijson reads
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, prefix, use_float=True)
+
+            # Reached only once the whole body parsed
+            if conditional:
+                self._pending_validators[url] = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                }
+
+    def _conditional_headers(self, url: str) -> dict:
+        """Request headers revalidating the copy of url fetched last time"""
+        validators = self.db.get_kv(f"http-validators:{url}") or {}
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+
+
+def run_scrapers(scrapers: List[BaseScraper]) -> Iterator[ScrapeLog]:
+    """
+    Run scrapers concurrently, one thread each, yielding each log as its
+    scraper finishes.
+
+    Scrapers are network-bound against different hosts, so this takes as
+    long as the slowest one. Their database writes are serialized by
+    BountyDatabase's writer lock.
+    """
+    if not scrapers:
+        return
+
+    with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+        futures = [executor.submit(scraper.run) for scraper in scrapers]
+        for future in as_completed(futures):
+            yield future.result()
@@ -6,7 +6,9 @@ Endpoint: https://hackerone.com/graphql
 """
 
 import logging
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
 
 from .base import BaseScraper
 from db.models import Program
@@ -14,114 +16,165 @@ from db.models import Program
 logger = logging.getLogger(__name__)
 
 
+class QueryRejected(Exception):
+    """The GraphQL API answered with errors, e.g. an unsupported filter"""
+
+
 class HackerOneScraper(BaseScraper):
     """Scraper for HackerOne public bug bounty programs"""
 
     GRAPHQL_URL = "https://hackerone.com/graphql"
 
+    # GraphQL query for directory (simplified - HackerOne changed their schema)
+    DIRECTORY_QUERY = """
+    query DirectoryQuery($cursor: String, $where: FiltersTeamFilterInput) {
+      teams(
+        first: 100
+        after: $cursor
+        secure_order_by: {started_accepting_at: {_direction: DESC}}
+        where: $where
+      ) {
+        pageInfo {
+          endCursor
+          hasNextPage
+        }
+        edges {
+          node {
+            id
+            handle
+            name
+            currency
+            submission_state
+            offers_bounties
+            base_bounty
+            started_accepting_at
+          }
+        }
+      }
+    }
+    """
+
+    PUBLIC_FILTER = {"state": {"_eq": "public_mode"}}
+
+    # Between full scans, only programs that started accepting reports since
+    # the previous scrape (minus some overlap) are fetched
+    FULL_SCAN_INTERVAL = timedelta(days=1)
+    DELTA_OVERLAP = timedelta(hours=1)
+
     def get_platform_name(self) -> str:
         return "hackerone"
 
     def scrape_programs(self) -> List[Program]:
         """
         Scrape all public programs from HackerOne directory using GraphQL API.
+
+        When a full scan ran within FULL_SCAN_INTERVAL, only programs newer
+        than the last scrape are fetched instead, falling back to a full scan
+        if that filter is rejected. Fetch errors propagate, so a failed scrape
+        is logged as such and doesn't advance the delta watermark.
+        """
+        now = datetime.now(timezone.utc)
+        last_full_scan = self.db.last_scrape_at(self.platform_name, full_scan=True)
+        last_scrape = self.db.last_scrape_at(self.platform_name)
+
+        self.full_scan = not (last_full_scan and now - last_full_scan < self.FULL_SCAN_INTERVAL)
+        if not self.full_scan:
+            since = (last_scrape - self.DELTA_OVERLAP).isoformat(timespec='seconds')
+            logger.info(f"Fetching HackerOne programs started since {since}")
+            try:
+                programs = self._scrape_cursor({**self.PUBLIC_FILTER, "started_accepting_at": {"_gte": since}})
+            except QueryRejected:
+                logger.warning("HackerOne rejected the delta filter, running a full scan")
+                self.full_scan = True
+            else:
+                logger.info(f"Scraped {len(programs)} new programs from HackerOne")
+                return programs
+
+        programs = self._scrape_cursor(self.PUBLIC_FILTER)
+        logger.info(f"Scraped {len(programs)} programs from HackerOne")
+        return programs
+
+    def _scrape_cursor(self, where: dict) -> List[Program]:
+        """
+        Page through every program matching a where filter.
+
+        Pages are cursor-chained, so while one page is parsed the request
+        for the next is already in flight on a background thread.
+        Raises on fetch errors and QueryRejected on GraphQL errors, rather
+        than returning a partial result.
         """
         programs = []
-        cursor = None
         page = 1
 
-        while True:
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
             logger.info(f"Fetching HackerOne page {page}")
+            pending = prefetcher.submit(self._fetch_page, None, where)
 
-            # GraphQL query for directory (simplified - HackerOne changed their schema)
-            query = """
-            query DirectoryQuery($cursor: String) {
-              teams(
-                first: 100
-                after: $cursor
-                secure_order_by: {started_accepting_at: {_direction: DESC}}
-                where: {
-                  state: {_eq: public_mode}
-                }
-              ) {
-                pageInfo {
-                  endCursor
-                  hasNextPage
-                }
-                edges {
-                  node {
-                    id
-                    handle
-                    name
-                    currency
-                    state
-                    submission_state
-                    offers_bounties
-                    offers_swag
-                    base_bounty
-                    url
-                    started_accepting_at
-                  }
-                }
-              }
-            }
-            """
-
-            variables = {"cursor": cursor} if cursor else {}
+            while pending is not None:
+                try:
+                    teams_data = pending.result()
+                except Exception as e:
+                    logger.error(f"Error fetching HackerOne page {page}: {e}")
+                    raise
 
-            try:
-                response = self.session.post(
-                    self.GRAPHQL_URL,
-                    json={"query": query, "variables": variables},
-                    timeout=30
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                if 'errors' in data:
-                    logger.error(f"GraphQL errors: {data['errors']}")
-                    break
+                if teams_data is None:
+                    raise QueryRejected(f"GraphQL errors on HackerOne page {page}")
 
-                teams_data = data.get('data', {}).get('teams', {})
                 edges = teams_data.get('edges', [])
                 page_info = teams_data.get('pageInfo', {})
 
                 if not edges:
                     break
 
+                # Start on the next page before parsing this one
+                pending = None
+                if page_info.get('hasNextPage'):
+                    logger.info(f"Fetching HackerOne page {page + 1}")
+                    pending = prefetcher.submit(self._fetch_page, page_info.get('endCursor'), where)
+
                 # Parse each program
-                for edge in edges:
-                    node = edge['node']
-                    program = self._parse_program(node)
-                    if program:
-                        programs.append(program)
-
-                # Check if there are more pages
-                if not page_info.get('hasNextPage'):
-                    break
+                parse = self._parse_program
+                programs.extend(parse(edge['node']) for edge in edges)
 
-                cursor = page_info.get('endCursor')
                 page += 1
 
-            except Exception as e:
-                logger.error(f"Error fetching HackerOne page {page}: {e}")
-                break
-
-        logger.info(f"Scraped {len(programs)} programs from HackerOne")
         return programs
 
+    def _fetch_page(self, cursor: Optional[str], where: dict) -> Optional[dict]:
+        """
+        Fetch one directory page.
+        Returns the teams connection, or None if GraphQL reported errors.
+        """
+        variables = {"where": where}
+        if cursor:
+            variables["cursor"] = cursor
+
+        response = self.post(
+            self.GRAPHQL_URL,
+            json={"query": self.DIRECTORY_QUERY, "variables": variables},
+            timeout=30
+        )
+        data = response.json()
+
+        if 'errors' in data:
+            logger.error(f"GraphQL errors: {data['errors']}")
+            return None
+
+        return data.get('data', {}).get('teams', {})
+
     def _parse_program(self, node: dict) -> Program:
         """Parse a HackerOne program node into a Program object"""
-        handle = node.get('handle', '')
-        name = node.get('name', handle)
+        # Bound once; this runs for every program in the directory
+        get = node.get
+        handle = get('handle', '')
+        name = get('name', handle)
 
         # Determine if VDP only
-        offers_bounties = node.get('offers_bounties', False)
-        submission_state = node.get('submission_state', '')
-        vdp_only = not offers_bounties
+        offers_bounties = bool(get('offers_bounties', False))
+        submission_state = get('submission_state', '')
 
         # Parse bounty amounts (base_bounty is a minimum)
-        base_bounty = node.get('base_bounty')
+        base_bounty = get('base_bounty')
         bounty_min = None
         bounty_max = None
 
@@ -140,11 +193,11 @@ class HackerOneScraper(BaseScraper):
             url=url,
             bounty_min=bounty_min,
             bounty_max=bounty_max,
-            currency=node.get('currency', 'USD'),
+            currency=get('currency', 'USD'),
             assets=[],  # Would need individual page scraping
             asset_types=[],  # Would need individual page scraping
             managed=False,  # Can't determine from directory
-            vdp_only=vdp_only,
+            vdp_only=not offers_bounties,
             accepts_submissions=(submission_state == 'open'),
             offers_bounties=offers_bounties,
             raw_data=node
@@ -9,8 +9,9 @@ Source: https://github.com/projectdiscovery/public-bugbounty-programs
 
 import logging
 import re
+from functools import lru_cache
 from typing import List
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, urlparse
 
 from .base import BaseScraper
 from db.models import Program
@@ -18,6 +19,30 @@ from config import PROJECTDISCOVERY_JSON_URL
 
 logger = logging.getLogger(__name__)
 
+# Host fragments identifying each platform, checked in order
+PLATFORM_HOSTS = (
+    ('hackerone.com', 'hackerone'),
+    ('bugcrowd.com', 'bugcrowd'),
+    ('intigriti.com', 'intigriti'),
+    ('yeswehack.com', 'yeswehack'),
+    ('immunefi.com', 'immunefi'),
+    ('code4rena.com', 'code4rena'),
+    ('huntr.dev', 'huntr'),
+    ('huntr.com', 'huntr'),
+    ('algora.io', 'algora'),
+)
+
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+
+@lru_cache(maxsize=1024)
+def _platform_for_host(host: str) -> str:
+    """Platform for a lowercased host; the list repeats a few hosts thousands of times"""
+    for fragment, platform in PLATFORM_HOSTS:
+        if fragment in host:
+            return platform
+    return 'other'
+
 
 class ProjectDiscoveryScraper(BaseScraper):
     """Seed database using ProjectDiscovery's public bug bounty list"""
@@ -29,21 +54,27 @@ class ProjectDiscoveryScraper(BaseScraper):
         """
         Fetch and parse the chaos-bugbounty-list.json from GitHub.
         Returns programs from all platforms.
+
+        Entries are parsed as they stream in, so the response body is never
+        buffered whole. Each entry dict is still kept as its Program's raw_data.
+        Returns no programs if the list hasn't changed since the last run.
         """
         logger.info(f"Fetching ProjectDiscovery list from {PROJECTDISCOVERY_JSON_URL}")
 
         try:
-            data = self.fetch_json(PROJECTDISCOVERY_JSON_URL)
-            programs_data = data.get('programs', [])
-
-            logger.info(f"Found {len(programs_data)} programs in ProjectDiscovery list")
-
             programs = []
-            for item in programs_data:
+            items = self.fetch_json_stream(PROJECTDISCOVERY_JSON_URL, 'programs.item', conditional=True)
+            for item in items:
                 program = self._parse_program(item)
                 if program:
                     programs.append(program)
 
+            if self.unchanged:
+                logger.info("ProjectDiscovery list not modified since last fetch")
+                return []
+
+            logger.info(f"Found {len(programs)} programs in ProjectDiscovery list")
+
             return programs
 
         except Exception as e:
@@ -53,12 +84,13 @@ class ProjectDiscoveryScraper(BaseScraper):
     def _parse_program(self, item: dict) -> Program:
         """Parse a ProjectDiscovery entry into a Program object"""
 
-        # Extract platform from URL
+        # Extract platform from URL (parsed once for platform and slug)
         url = item.get('url', '')
-        platform = self._detect_platform(url)
+        parsed = urlparse(url)
+        platform = self._detect_platform(url, parsed.netloc)
 
         # Generate slug from URL or name
-        slug = self._generate_slug(url, item.get('name', ''))
+        slug = self._generate_slug(url, item.get('name', ''), parsed)
 
         # Parse bounty info if available
         bounty_min = None
@@ -92,41 +124,22 @@ class ProjectDiscoveryScraper(BaseScraper):
 
         return program
 
-    def _detect_platform(self, url: str) -> str:
+    def _detect_platform(self, url: str, netloc: str) -> str:
         """Detect platform from program URL"""
         if not url:
             return "unknown"
 
-        domain = urlparse(url).netloc.lower()
-
-        if 'hackerone.com' in domain:
-            return 'hackerone'
-        elif 'bugcrowd.com' in domain:
-            return 'bugcrowd'
-        elif 'intigriti.com' in domain:
-            return 'intigriti'
-        elif 'yeswehack.com' in domain:
-            return 'yeswehack'
-        elif 'immunefi.com' in domain:
-            return 'immunefi'
-        elif 'code4rena.com' in domain:
-            return 'code4rena'
-        elif 'huntr.dev' in domain or 'huntr.com' in domain:
-            return 'huntr'
-        elif 'algora.io' in domain:
-            return 'algora'
-        else:
-            return 'other'
+        return _platform_for_host(netloc.lower())
 
-    def _generate_slug(self, url: str, name: str) -> str:
+    def _generate_slug(self, url: str, name: str, parsed: ParseResult) -> str:
         """Generate a slug from URL or name"""
         if not url:
             # Use name
-            slug = re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+            slug = _SLUG_RE.sub('-', name.lower()).strip('-')
             return slug
 
         # Extract from URL path
-        path = urlparse(url).path.strip('/')
+        path = parsed.path.strip('/')
         parts = path.split('/')
 
         # For HackerOne: hackerone.com/company -> company
@@ -135,9 +148,9 @@ class ProjectDiscoveryScraper(BaseScraper):
         if parts:
             slug = parts[-1]
         else:
-            slug = urlparse(url).netloc.replace('.', '-')
+            slug = parsed.netloc.replace('.', '-')
 
-        slug = re.sub(r'[^a-z0-9]+', '-', slug.lower()).strip('-')
+        slug = _SLUG_RE.sub('-', slug.lower()).strip('-')
         return slug or 'unknown'
 
     def _detect_asset_types(self, domains: list) -> list:
@@ -0,0 +1,58 @@
+"""
+Per-host rate limiting shared by all scrapers
+
+Requests to the same host are spaced out by REQUEST_DELAY, while requests
+to different hosts (e.g. concurrent scrapers) don't wait on each other.
+"""
+
+import threading
+import time
+from urllib.parse import urlparse
+
+from config import REQUEST_DELAY
+
+
+class RateLimiter:
+    """Token bucket allowing one request per interval, with optional bursts"""
+
+    def __init__(self, interval: float, burst: int = 1):
+        self.interval = interval
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be made"""
+        if self.interval <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._tokens = min(self.burst, self._tokens + elapsed / self.interval)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) * self.interval
+
+            time.sleep(wait)
+
+
+_limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def limiter_for(url: str) -> RateLimiter:
+    """Get the shared rate limiter for a URL's host"""
+    host = urlparse(url).netloc.lower()
+
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = _limiters[host] = RateLimiter(REQUEST_DELAY)
+        return limiter
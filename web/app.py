@@ -4,8 +4,14 @@ BountyPing Flask Web App
 Simple web interface for browsing and filtering bug bounty programs.
 """
 
+import hashlib
 import logging
-from flask import Flask, render_template, request, jsonify
+import threading
+import time
+from collections import OrderedDict
+
+import orjson
+from flask import Flask, render_template, request
 from flask_cors import CORS
 
 from config import FLASK_HOST, FLASK_PORT, SECRET_KEY, DB_PATH, ADMIN_SECRET
@@ -26,6 +32,67 @@ CORS(app)
 # Initialize database
 db = BountyDatabase(DB_PATH)
 
+# Serialized /api/programs responses kept per filter combination. Each
+# entry holds a whole program list, so only a few are kept, one per filter
+# combination, and free-text searches aren't cached at all.
+PROGRAMS_CACHE_SIZE = 32
+PROGRAMS_MAX_AGE = 60
+
+_programs_cache: OrderedDict[tuple, tuple[tuple, bytes, str]] = OrderedDict()
+_programs_cache_lock = threading.Lock()
+
+
+def _ojson(obj, status: int = 200):
+    """Build a JSON response with orjson instead of the stdlib encoder"""
+    return app.response_class(
+        orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+def _serialize_programs(filters: dict) -> tuple[bytes, str]:
+    """Serialize the program list for filters. Returns (body, etag)."""
+    programs = db.get_all_programs(filters)
+    body = orjson.dumps({
+        'programs': programs,
+        'count': len(programs)
+    })
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    return body, etag
+
+
+def _programs_payload(filters: dict) -> tuple[bytes, str]:
+    """
+    Serialized program list for filters, from the cache when still current.
+    An entry is current while data_version is unchanged, i.e. no scrape has
+    committed since; new_only entries also expire with the sliding cutoff.
+    Returns (body, etag).
+    """
+    if 'search' in filters:
+        return _serialize_programs(filters)
+
+    key = tuple(sorted(filters.items()))
+    window = int(time.time() // PROGRAMS_MAX_AGE) if filters.get('new_only') else 0
+    version = (db.data_version(), window)
+
+    with _programs_cache_lock:
+        cached = _programs_cache.get(key)
+        if cached and cached[0] == version:
+            _programs_cache.move_to_end(key)
+            return cached[1], cached[2]
+
+    body, etag = _serialize_programs(filters)
+
+    # Replaces the stale entry for this key rather than adding another
+    with _programs_cache_lock:
+        _programs_cache[key] = (version, body, etag)
+        _programs_cache.move_to_end(key)
+        while len(_programs_cache) > PROGRAMS_CACHE_SIZE:
+            _programs_cache.popitem(last=False)
+
+    return body, etag
+
 
 @app.route('/')
 def index():
@@ -46,6 +113,7 @@ def get_programs():
     - sort_by: Sort order (newest, bounty, name)
     - new_only: Only show programs from last 7 days (true/false)
     - bounties_only: Only show paid programs (true/false)
+    - limit: Maximum number of programs to return
     """
     filters = {}
 
@@ -73,19 +141,26 @@ def get_programs():
     if request.args.get('bounties_only') == 'true':
         filters['bounties_only'] = True
 
-    programs = db.get_all_programs(filters)
+    if limit := request.args.get('limit'):
+        try:
+            filters['limit'] = int(limit)
+        except ValueError:
+            pass
 
-    return jsonify({
-        'programs': programs,
-        'count': len(programs)
-    })
+    body, etag = _programs_payload(filters)
+
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = PROGRAMS_MAX_AGE
+    return response.make_conditional(request)
 
 
 @app.route('/api/stats')
 def get_stats():
     """Get database statistics"""
     stats = db.get_stats()
-    return jsonify(stats)
+    return _ojson(stats)
 
 
 @app.route('/api/platforms')
@@ -96,7 +171,7 @@ def get_platforms():
         {'name': platform, 'count': count}
         for platform, count in stats['by_platform'].items()
     ]
-    return jsonify({'platforms': platforms})
+    return _ojson({'platforms': platforms})
 
 
 @app.route('/api/admin/scrape-logs')
@@ -105,10 +180,10 @@ def get_scrape_logs():
     # Simple admin auth via header
     admin_secret = request.headers.get('X-Admin-Secret')
     if admin_secret != ADMIN_SECRET or not ADMIN_SECRET:
-        return jsonify({'error': 'Unauthorized'}), 401
+        return _ojson({'error': 'Unauthorized'}, 401)
 
     logs = db.get_recent_logs(limit=50)
-    return jsonify({'logs': logs})
+    return _ojson({'logs': logs})
 
 
 @app.route('/api/admin/seed', methods=['POST'])
@@ -117,35 +192,36 @@ def seed_database():
     # Simple admin auth via header
     admin_secret = request.headers.get('X-Admin-Secret')
     if admin_secret != ADMIN_SECRET or not ADMIN_SECRET:
-        return jsonify({'error': 'Unauthorized'}), 401
+        return _ojson({'error': 'Unauthorized'}, 401)
 
     try:
         from scrapers.projectdiscovery import ProjectDiscoveryScraper
 
         logger.info("Starting database seed via API")
-        scraper = ProjectDiscoveryScraper(db)
-        log = scraper.run()
+        with ProjectDiscoveryScraper(db) as scraper:
+            log = scraper.run()
 
         if log.success:
-            return jsonify({
+            return _ojson({
                 'success': True,
-                'message': 'Database seeded successfully',
+                'message': 'Source unchanged, nothing to seed' if log.unchanged else 'Database seeded successfully',
+                'unchanged': log.unchanged,
                 'programs_found': log.programs_found,
                 'programs_new': log.programs_new,
                 'programs_updated': log.programs_updated
             })
         else:
-            return jsonify({
+            return _ojson({
                 'success': False,
                 'error': log.error_message
-            }), 500
+            }, 500)
 
     except Exception as e:
         logger.error(f"Seed failed: {e}", exc_info=True)
-        return jsonify({
+        return _ojson({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 @app.route('/api/admin/scrape-hackerone', methods=['POST'])
@@ -153,35 +229,36 @@ def scrape_hackerone():
     """Scrape HackerOne programs (admin only)"""
     admin_secret = request.headers.get('X-Admin-Secret')
     if admin_secret != ADMIN_SECRET or not ADMIN_SECRET:
-        return jsonify({'error': 'Unauthorized'}), 401
+        return _ojson({'error': 'Unauthorized'}, 401)
 
     try:
         from scrapers.hackerone import HackerOneScraper
 
         logger.info("Starting HackerOne scrape via API")
-        scraper = HackerOneScraper(db)
-        log = scraper.run()
+        with HackerOneScraper(db) as scraper:
+            log = scraper.run()
 
         if log.success:
-            return jsonify({
+            return _ojson({
                 'success': True,
                 'message': 'HackerOne scrape complete',
+                'unchanged': log.unchanged,
                 'programs_found': log.programs_found,
                 'programs_new': log.programs_new,
                 'programs_updated': log.programs_updated
             })
         else:
-            return jsonify({
+            return _ojson({
                 'success': False,
                 'error': log.error_message
-            }), 500
+            }, 500)
 
     except Exception as e:
         logger.error(f"HackerOne scrape failed: {e}", exc_info=True)
-        return jsonify({
+        return _ojson({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 @app.route('/api/admin/test-scraper', methods=['POST'])
@@ -189,7 +266,7 @@ def test_scraper():
     """Test scraper dependencies"""
     admin_secret = request.headers.get('X-Admin-Secret')
     if admin_secret != ADMIN_SECRET or not ADMIN_SECRET:
-        return jsonify({'error': 'Unauthorized'}), 401
+        return _ojson({'error': 'Unauthorized'}, 401)
 
     try:
         import requests
@@ -199,27 +276,26 @@ def test_scraper():
         response = requests.get('https://raw.githubusercontent.com/projectdiscovery/public-bugbounty-programs/main/chaos-bugbounty-list.json', timeout=10)
         data = response.json()
 
-        return jsonify({
+        return _ojson({
             'success': True,
             'requests_works': True,
             'programs_in_json': len(data.get('programs', [])),
             'sample_program': data.get('programs', [])[0] if data.get('programs') else None
         })
     except Exception as e:
-        return jsonify({
+        return _ojson({
             'success': False,
             'error': str(e),
             'error_type': type(e).__name__
-        }), 500
+        }, 500)
 
 
 @app.route('/health')
 def health():
     """Health check endpoint"""
-    stats = db.get_stats()
-    return jsonify({
+    return _ojson({
         'status': 'ok',
-        'total_programs': stats['total_programs']
+        'total_programs': db.total_programs()
     })
 
 